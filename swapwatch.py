@@ -4,19 +4,35 @@ import psutil
 import time
 import os
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import heapq
+from collections import deque
+from itertools import islice
 import subprocess
 import sys
 import argparse  # Import argparse for command-line argument parsing
 
 # Logging setup
+# log_action() only queues records; log_listener writes them to LOG_FILE from its own thread
+# so a slow disk can't stall the UI. main() starts and stops the listener.
 LOG_FILE = "/var/log/swapwatch.log"
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format='%(asctime)s - %(message)s',  # Logging module adds timestamp
+log_file_handler = logging.FileHandler(LOG_FILE)
+log_file_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(message)s',  # Logging module adds timestamp
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+log_queue = queue.Queue()
+log_listener = logging.handlers.QueueListener(log_queue, log_file_handler)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+logging.getLogger().setLevel(logging.INFO)
+
+# Total RAM doesn't change while SwapWatch runs, so read it once
+TOTAL_PHYSICAL_MEMORY = psutil.virtual_memory().total
+MEMORY_PERCENT_PER_BYTE = 100.0 / TOTAL_PHYSICAL_MEMORY
+
+# /proc/<pid>/statm counts pages
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
 
 # Monitored applications mapping: process names to service names and include_children flag
 # Specify which apps should include child processes
@@ -37,16 +53,44 @@ monitored_apps = {
     "nginx": ("nginx", True)  # Include nginx and combine child processes
 }
 
+# Lookups derived from monitored_apps, built once since the mapping doesn't change at runtime
+MON_NAMES = tuple(monitored_apps)  # Menu order
+MON_SERVICE_BY_NAME = {proc_name: service_name for proc_name, (service_name, _) in monitored_apps.items()}
+# Names long enough to show up truncated in /proc/<pid>/stat (comm is at most 15 bytes)
+MON_LONG_NAMES = tuple(name.encode() for name in monitored_apps if len(name.encode()) >= 15)
+
 # Default swap thresholds (can be overridden via command-line arguments)
 SWAP_HIGH_THRESHOLD = 75  # Threshold to start taking action
 SWAP_LOW_THRESHOLD = 50   # Target swap usage to achieve
 
+# Below this much swap in use (bytes) there is nothing worth reclaiming, even if a tiny
+# swap device shows a high percentage
+MIN_SWAP_USED = 1 << 20  # 1 MiB
+
 # Check interval in seconds (5 minutes)
 CHECK_INTERVAL = 300
 
+# Shortest gap between checks when the UI sample already shows swap above the high threshold
+MIN_CHECK_INTERVAL = 30
+
 # UI update interval in seconds
 UI_UPDATE_INTERVAL = 1  # Update UI every 1 second
 
+# How often (seconds) the top apps pane rescans processes; memory and swap still update every UI tick
+TOP_APPS_UPDATE_INTERVAL = 5
+
+# After dropping caches or restarting a service, poll swap this often (seconds) for up to
+# SWAP_SETTLE_TIMEOUT seconds instead of sleeping blindly
+SWAP_POLL_INTERVAL = 0.2
+SWAP_SETTLE_TIMEOUT = 5
+
+# Number of log lines kept for the log window (older lines are dropped)
+MAX_LOG_LINES = 2000
+
+# Smallest terminal the layout fits in: title, two 7-row panes and a log window with one line
+MIN_TERM_HEIGHT = 13
+MIN_TERM_WIDTH = 20
+
 # Help text for command-line arguments
 CMD_HELP_TEXT = """
 SwapWatch Command-Line Options:
@@ -84,6 +128,9 @@ Features:
 - Interactive menu to manually restart monitored services.
 """
 
+# Help text split into screen lines once, instead of on every '?' press
+APP_HELP_LINES = APP_HELP_TEXT.strip().split('\n')
+
 # Initialize curses
 def init_curses():
     stdscr = curses.initscr()
@@ -91,7 +138,7 @@ def init_curses():
     curses.cbreak()
     stdscr.keypad(True)
     curses.curs_set(0)  # Hide the cursor
-    stdscr.nodelay(True)  # Make getch non-blocking
+    stdscr.timeout(int(UI_UPDATE_INTERVAL * 1000))  # getch waits at most one UI tick; main() narrows this per iteration
     return stdscr
 
 # Close curses
@@ -101,11 +148,47 @@ def close_curses(stdscr):
     curses.echo()
     curses.endwin()
 
+# Descriptor for /proc/meminfo, opened on first use and kept for the life of the process
+_meminfo_fd = None
+
+# Read the named /proc/meminfo fields, in kB
+def _read_meminfo(*names):
+    global _meminfo_fd
+    if _meminfo_fd is None:
+        _meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
+    # Reading from offset 0 makes the kernel regenerate the file, so one pread() per sample is enough
+    data = os.pread(_meminfo_fd, 8192, 0)
+    values = []
+    for name in names:
+        start = data.index(name) + len(name)
+        values.append(int(data[start:data.index(b'kB', start)]))
+    return values
+
+# Read memory and swap usage straight from /proc/meminfo (Linux fast path)
+def _get_mem_swap_linux():
+    mem_total, mem_available, swap_total, swap_free = _read_meminfo(b'MemTotal:', b'MemAvailable:', b'SwapTotal:', b'SwapFree:')
+    # Same rounding as psutil's .percent fields
+    mem_percent = round((mem_total - mem_available) * 100 / mem_total, 1) if mem_total else 0.0
+    swap_percent = round((swap_total - swap_free) * 100 / swap_total, 1) if swap_total else 0.0
+    return mem_percent, swap_percent
+
 # Get memory and swap usage
 def get_memory_and_swap_usage():
-    mem = psutil.virtual_memory()
-    swap = psutil.swap_memory()
-    return mem.percent, swap.percent
+    try:
+        return _get_mem_swap_linux()
+    except (OSError, ValueError):
+        # /proc/meminfo missing or in an unexpected format, let psutil handle it
+        mem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        return mem.percent, swap.percent
+
+# Get the amount of swap in use, in bytes
+def get_swap_used_bytes():
+    try:
+        swap_total, swap_free = _read_meminfo(b'SwapTotal:', b'SwapFree:')
+        return (swap_total - swap_free) * 1024
+    except (OSError, ValueError):
+        return psutil.swap_memory().used
 
 # Restart app
 def restart_app(service_name, log_lines, log_scroll_pos):
@@ -131,27 +214,46 @@ def restart_app(service_name, log_lines, log_scroll_pos):
 # Drop caches
 def drop_caches(log_lines, log_scroll_pos):
     try:
-        subprocess.run(['sync'], check=True)
-        with open('/proc/sys/vm/drop_caches', 'w') as f:
-            f.write('3\n')
+        os.sync()
+        fd = os.open('/proc/sys/vm/drop_caches', os.O_WRONLY)
+        try:
+            os.write(fd, b'3\n')
+        finally:
+            os.close(fd)
         log_scroll_pos = log_action("Dropped caches", log_lines, log_scroll_pos)
     except Exception as e:
         log_scroll_pos = log_action(f"Failed to drop caches: {e}", log_lines, log_scroll_pos)
     return log_scroll_pos
 
+# Last formatted display timestamp and the wall-clock second it belongs to
+_timestamp_cache = (None, "")
+
+# Format the current time for the log window, reusing the string within the same second
+def log_timestamp():
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return _timestamp_cache[1]
+
 # Log actions
 def log_action(action, log_lines, log_scroll_pos):
     # For curses app display, add timestamp
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = log_timestamp()
     display_message = f"{timestamp} - {action}"
     # For log file, let logging module handle the timestamp
     logging.info(action)
     if log_lines is not None:
+        # A full deque drops its oldest line on append
+        dropped_line = len(log_lines) == log_lines.maxlen
         log_lines.append(display_message)
         # Adjust log_scroll_pos if the user is at the bottom
         if 'log_lines_visible' in globals():
             if log_scroll_pos >= len(log_lines) - (log_lines_visible + 1):
                 log_scroll_pos = len(log_lines) - log_lines_visible
+            elif dropped_line:
+                # Keep the same lines in view while the user is scrolled back
+                log_scroll_pos = max(log_scroll_pos - 1, 0)
         else:
             # If log_lines_visible is not defined yet, set log_scroll_pos to 0
             log_scroll_pos = max(len(log_lines) - 1, 0)
@@ -159,39 +261,62 @@ def log_action(action, log_lines, log_scroll_pos):
 
 # Update the log window
 def update_log_window(log_lines, bottom_win, log_scroll_pos):
-    bottom_win.erase()
-    bottom_win.box()
-    bottom_win.addstr(0, 2, "Logs")  # Redraw the title
-    log_height = bottom_win.getmaxyx()[0] - 2  # Exclude border
-    total_logs = len(log_lines)
-    visible_logs = log_lines[log_scroll_pos:log_scroll_pos + log_height]
+    win_height, win_width = bottom_win.getmaxyx()
+    log_height = win_height - 2  # Exclude border
+    max_width = win_width - 2  # Ensure the log line fits within the window width
+    # log_scroll_pos goes negative while there are fewer lines than rows; islice() needs a start >= 0
+    start = max(log_scroll_pos, 0)
+    visible_logs = list(islice(log_lines, start, log_scroll_pos + log_height))
+    # Overwrite every row inside the border so the box and title drawn by draw_chrome stay put
+    visible_logs += [""] * (log_height - len(visible_logs))
     for idx, log in enumerate(visible_logs):
-        # Ensure the log line fits within the window width
-        max_width = bottom_win.getmaxyx()[1] - 2
-        bottom_win.addstr(1 + idx, 1, log[:max_width])
-    bottom_win.refresh()
+        bottom_win.addnstr(1 + idx, 1, log.ljust(max_width), max_width)
+    bottom_win.noutrefresh()
     return log_scroll_pos
 
+# Snapshot of what the log window shows, used to skip redundant redraws
+def log_window_state(log_lines, log_scroll_pos):
+    # len() stops changing once the deque is full, so include the newest line too
+    return len(log_lines), log_scroll_pos, log_lines[-1] if log_lines else None
+
+# Wait for swap usage to react to an action
+# Returns as soon as it drops by a point or falls below the low threshold, or after SWAP_SETTLE_TIMEOUT
+def wait_for_swap_drop(swap_percent, swap_low_threshold):
+    deadline = time.monotonic() + SWAP_SETTLE_TIMEOUT
+    while True:
+        time.sleep(SWAP_POLL_INTERVAL)
+        current = get_memory_and_swap_usage()[1]
+        if current <= swap_percent - 1 or current < swap_low_threshold or time.monotonic() >= deadline:
+            return current
+
 # Monitor swap usage
-def monitor_swap_usage(log_lines, bottom_win, swap_high_threshold, swap_low_threshold, log_scroll_pos):
-    swap_percent = psutil.swap_memory().percent
-    if swap_percent >= swap_high_threshold:
+# With allow_restarts=False only caches are dropped; services are left for a later check
+# Returns the new log_scroll_pos and the swap usage the check finished at
+def monitor_swap_usage(log_lines, bottom_win, swap_high_threshold, swap_low_threshold, log_scroll_pos, swap_percent=None, allow_restarts=True):
+    # Use the caller's sample if one was taken this tick
+    if swap_percent is None:
+        swap_percent = get_memory_and_swap_usage()[1]
+    # Only look up the absolute amount once the percentage is over the threshold
+    swap_is_negligible = swap_percent >= swap_high_threshold and get_swap_used_bytes() < MIN_SWAP_USED
+    if swap_is_negligible:
+        log_scroll_pos = log_action(f"Swap usage is {swap_percent}%, but less than 1 MiB of swap is in use, so there is nothing to reclaim.", log_lines, log_scroll_pos)
+    elif swap_percent >= swap_high_threshold:
         log_scroll_pos = log_action(f"Swap usage is {swap_percent}%, which exceeds the threshold of {swap_high_threshold}%.", log_lines, log_scroll_pos)
         log_scroll_pos = drop_caches(log_lines, log_scroll_pos)
-        time.sleep(2)
-        swap_percent = psutil.swap_memory().percent
-        if swap_percent >= swap_low_threshold:
+        swap_percent = wait_for_swap_drop(swap_percent, swap_low_threshold)
+        if swap_percent >= swap_low_threshold and not allow_restarts:
+            log_scroll_pos = log_action(f"Swap usage still too high at {swap_percent}%, leaving service restarts to the next scheduled check.", log_lines, log_scroll_pos)
+        elif swap_percent >= swap_low_threshold:
             log_scroll_pos = log_action(f"Swap usage still too high at {swap_percent}%, restarting services based on memory usage.", log_lines, log_scroll_pos)
             # Get applications sorted by memory usage
             top_apps = get_top_memory_apps()
             apps_restarted = 0
             for app in top_apps:
                 proc_name = app['name']
-                service_name = monitored_apps[proc_name][0]
+                service_name = MON_SERVICE_BY_NAME[proc_name]
                 log_scroll_pos = restart_app(service_name, log_lines, log_scroll_pos)
                 apps_restarted += 1
-                time.sleep(2)
-                swap_percent = psutil.swap_memory().percent
+                swap_percent = wait_for_swap_drop(swap_percent, swap_low_threshold)
                 if swap_percent < swap_low_threshold:
                     log_scroll_pos = log_action(f"Done! Usage now at {swap_percent}% which is below the threshold of {swap_low_threshold}%", log_lines, log_scroll_pos)
                     log_scroll_pos = log_action("Resuming normal operations", log_lines, log_scroll_pos)
@@ -206,16 +331,17 @@ def monitor_swap_usage(log_lines, bottom_win, swap_high_threshold, swap_low_thre
             log_scroll_pos = log_action(f"Swap usage is {swap_percent}%, which is now below the target of {swap_low_threshold}%.", log_lines, log_scroll_pos)
     else:
         log_scroll_pos = log_action(f"Swap usage is {swap_percent}%, which is below the threshold of {swap_high_threshold}%.", log_lines, log_scroll_pos)
-    return log_scroll_pos
+    return log_scroll_pos, swap_percent
 
-# Set up the UI
-def setup_ui(stdscr):
-    height, width = stdscr.getmaxyx()
-
-    # Add the app name to the top of the screen
+# Add the app name to the top of the screen
+def draw_title(stdscr):
+    width = stdscr.getmaxyx()[1]
     title = "SwapWatch 1.0"
-    stdscr.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
-    stdscr.refresh()
+    stdscr.addnstr(0, max((width - len(title)) // 2, 0), title, width - 1, curses.A_BOLD)
+
+# Create the main windows
+def build_windows(stdscr):
+    height, width = stdscr.getmaxyx()
 
     top_left_h = 7
     top_right_h = 7
@@ -227,110 +353,258 @@ def setup_ui(stdscr):
     top_left_win = curses.newwin(top_left_h, top_left_w, 2, 0)
     top_right_win = curses.newwin(top_right_h, top_right_w, 2, top_left_w)
     bottom_win = curses.newwin(bottom_h, width, top_left_h + 2, 0)
+    return top_left_win, top_right_win, bottom_win
 
-    # Draw borders and titles
-    top_left_win.box()
-    top_left_win.addstr(0, 2, "Memory & Swap Usage")
-    top_left_win.refresh()
-
-    top_right_win.box()
-    top_right_win.addstr(0, 2, "Top Apps by Memory Usage")
-    top_right_win.refresh()
+# Whether the terminal is big enough for build_windows()
+def terminal_fits(stdscr):
+    height, width = stdscr.getmaxyx()
+    return height >= MIN_TERM_HEIGHT and width >= MIN_TERM_WIDTH
 
-    bottom_win.box()
-    bottom_win.addstr(0, 2, "Logs")
-    bottom_win.refresh()
+# Shown instead of the windows until a resize makes room for them again
+def draw_too_small(stdscr):
+    stdscr.erase()
+    try:
+        stdscr.addnstr(0, 0, "Terminal too small", stdscr.getmaxyx()[1] - 1)
+    except curses.error:
+        pass  # Not even room for the notice
+    stdscr.noutrefresh()
+
+# Draw a window's border and title, queued for the next doupdate()
+def draw_frame(win, title):
+    win.box()
+    win.addnstr(0, 2, title, max(win.getmaxyx()[1] - 4, 0))  # Keep the title off the corner
+    win.noutrefresh()
+
+# Draw the static parts of the screen: app title, borders and window titles
+# These only change on resize, so the per-tick updates leave them alone
+def draw_chrome(stdscr, top_left_win, top_right_win, bottom_win):
+    draw_title(stdscr)
+    stdscr.noutrefresh()
+    draw_frame(top_left_win, "Memory & Swap Usage")
+    draw_frame(top_right_win, "Top Apps by Memory Usage")
+    draw_frame(bottom_win, "Logs")
 
-    return top_left_win, top_right_win, bottom_win
+# Set up the UI
+def setup_ui(stdscr):
+    windows = build_windows(stdscr)
+    draw_chrome(stdscr, *windows)
+    return windows
+
+# Repaint the existing windows after a full-screen dialog is closed
+def restore_ui(stdscr, top_left_win, top_right_win, bottom_win):
+    draw_title(stdscr)  # Dialogs erase stdscr, so the title has to be put back
+    for win in (stdscr, top_left_win, top_right_win, bottom_win):
+        win.touchwin()
+        win.noutrefresh()
+    curses.doupdate()
+
+# The kernel cuts comm to 15 bytes, so like psutil's name() recover a longer name
+# from argv[0] when it starts with the truncated comm
+def _full_proc_name(pid, comm):
+    try:
+        fd = os.open(f'/proc/{pid}/cmdline', os.O_RDONLY)
+        try:
+            cmdline = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except OSError:
+        return comm
+    exe_name = os.path.basename(cmdline.split(b'\0', 1)[0])
+    return exe_name if exe_name.startswith(comm) else comm
+
+# Find monitored processes and build a parent -> children map in one pass over /proc
+def _scan_proc_linux():
+    matches = []
+    children_by_ppid = {}
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                fd = os.open(f'/proc/{entry.name}/stat', os.O_RDONLY)
+                try:
+                    stat = os.read(fd, 8192)
+                finally:
+                    os.close(fd)
+            except OSError:
+                continue
+            # comm sits in parentheses and may itself contain spaces or ')'
+            comm_end = stat.rfind(b')')
+            pid = int(entry.name)
+            ppid = int(stat[comm_end + 2:].split(None, 2)[1])
+            children_by_ppid.setdefault(ppid, []).append(pid)
+            comm = stat[stat.find(b'(') + 1:comm_end]
+            # Only read argv[0] when a long monitored name could be behind a truncated comm
+            if len(comm) >= 15 and any(name.startswith(comm) for name in MON_LONG_NAMES):
+                comm = _full_proc_name(pid, comm)
+            proc_name = comm.decode('utf-8', 'replace')
+            if proc_name in monitored_apps:
+                matches.append((pid, proc_name))
+    return matches, children_by_ppid
+
+# Collect every descendant PID of a process from the parent -> children map
+def _descendant_pids(pid, children_by_ppid):
+    descendants = []
+    pending = list(children_by_ppid.get(pid, ()))
+    while pending:
+        child = pending.pop()
+        descendants.append(child)
+        pending.extend(children_by_ppid.get(child, ()))
+    return descendants
+
+# Add one process's RSS to its app's running total
+def _add_app_memory(app_memory, proc_name, total_rss, include_children, has_children):
+    if proc_name in app_memory:
+        app_memory[proc_name]['rss'] += total_rss
+        app_memory[proc_name]['has_children'] = app_memory[proc_name]['has_children'] or has_children
+    else:
+        app_memory[proc_name] = {
+            'name': proc_name,
+            'rss': total_rss,
+            'include_children': include_children,
+            'has_children': has_children
+        }
+
+# Find monitored processes and build a parent -> children map in one psutil pass (used when /proc can't be scanned)
+def _scan_proc_psutil():
+    matches = []
+    children_by_ppid = {}
+    for proc in psutil.process_iter(['pid', 'ppid', 'name']):
+        pid, ppid, proc_name = proc.info['pid'], proc.info['ppid'], proc.info['name']
+        children_by_ppid.setdefault(ppid, []).append(pid)
+        if proc_name in monitored_apps:
+            matches.append((pid, proc_name))
+    return matches, children_by_ppid
+
+# Read a process's RSS in bytes from /proc/<pid>/statm, or None if it has gone away
+def _read_rss_linux(pid):
+    try:
+        fd = os.open(f'/proc/{pid}/statm', os.O_RDONLY)
+        try:
+            statm = os.read(fd, 256)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+    return int(statm.split()[1]) * PAGE_SIZE
+
+# Read a process's RSS in bytes through psutil, or None if it has gone away
+def _read_rss_psutil(pid):
+    try:
+        return psutil.Process(pid).memory_info().rss
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
 
-# Get top memory apps
-def get_top_memory_apps():
-    app_memory_usage = []
-    monitored_process_names = list(monitored_apps.keys())
-    total_physical_memory = psutil.virtual_memory().total
+# Sum RSS per monitored app, adding descendants for apps that include children
+def _collect_app_memory(matches, children_by_ppid, read_rss):
     app_memory = {}
-    for proc in psutil.process_iter(['pid', 'name']):
-        try:
-            proc_name = proc.info['name']
-            if proc_name in monitored_process_names:
-                include_children = monitored_apps[proc_name][1]
-                total_rss = proc.memory_info().rss
-                has_children = False
-                if include_children:
-                    children = proc.children(recursive=True)
-                    has_children = len(children) > 0
-                    for child in children:
-                        try:
-                            total_rss += child.memory_info().rss
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            continue
-                if proc_name in app_memory:
-                    app_memory[proc_name]['rss'] += total_rss
-                    app_memory[proc_name]['has_children'] = app_memory[proc_name]['has_children'] or has_children
-                else:
-                    app_memory[proc_name] = {
-                        'name': proc_name,
-                        'rss': total_rss,
-                        'include_children': include_children,
-                        'has_children': has_children
-                    }
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+    for pid, proc_name in matches:
+        include_children = monitored_apps[proc_name][1]
+        total_rss = read_rss(pid)
+        if total_rss is None:
             continue
+        has_children = False
+        if include_children:
+            children = _descendant_pids(pid, children_by_ppid)
+            has_children = len(children) > 0
+            for child in children:
+                total_rss += read_rss(child) or 0
+        _add_app_memory(app_memory, proc_name, total_rss, include_children, has_children)
+    return app_memory
+
+# Get top memory apps, largest first
+# With a limit only that many are returned, picked with a partial sort
+def get_top_memory_apps(limit=None):
+    app_memory_usage = []
+    try:
+        matches, children_by_ppid = _scan_proc_linux()
+        read_rss = _read_rss_linux
+    except OSError:
+        matches, children_by_ppid = _scan_proc_psutil()
+        read_rss = _read_rss_psutil
+    app_memory = _collect_app_memory(matches, children_by_ppid, read_rss)
     # Now calculate memory_percent for each app
     for app in app_memory.values():
-        mem_percent = (app['rss'] / total_physical_memory) * 100
-        app['memory_percent'] = mem_percent
+        app['memory_percent'] = app['rss'] * MEMORY_PERCENT_PER_BYTE
     # Convert to a list and sort
+    if limit is not None:
+        return heapq.nlargest(limit, app_memory.values(), key=lambda x: x['memory_percent'])
     app_memory_usage = list(app_memory.values())
     app_memory_usage.sort(key=lambda x: x['memory_percent'], reverse=True)
     return app_memory_usage
 
 # Update dynamic data on the screen
-def update_ui(top_left_win, top_right_win):
-    # Memory and Swap Usage
-    mem_usage, swap_usage = get_memory_and_swap_usage()
-
-    # Redraw the border and title
-    top_left_win.box()
-    top_left_win.addstr(0, 2, "Memory & Swap Usage")
-
-    # Update only the usage lines without clearing the entire window
-    top_left_win.addstr(2, 2, f"Memory Usage: {mem_usage:.2f}%    ")
-    top_left_win.addstr(3, 2, f"Swap Usage: {swap_usage:.2f}%     ")
-    top_left_win.refresh()
-
-    # Top apps by memory usage
-    top_apps = get_top_memory_apps()[:3]  # Get top 3 apps
-
-    # Redraw the border and title
-    top_right_win.box()
-    top_right_win.addstr(0, 2, "Top Apps by Memory Usage")
-
-    # Clear only the area where app data is displayed
-    for idx in range(3):
-        # Overwrite previous data with spaces
-        top_right_win.addstr(2 + idx, 2, " " * (top_right_win.getmaxyx()[1] - 4))
-    for idx, app in enumerate(top_apps):
+# Returns the rendered state; pass it back in as last_state to skip redrawing unchanged panes
+def update_ui(top_left_win, top_right_win, last_state=None, usage=None, top_apps=None):
+    # Memory and Swap Usage, sampled here unless the caller already did
+    mem_usage, swap_usage = usage if usage is not None else get_memory_and_swap_usage()
+    usage_lines = (f"Memory Usage: {mem_usage:.2f}%", f"Swap Usage: {swap_usage:.2f}%")
+
+    # Top apps by memory usage, scanned here unless the caller passes a recent scan
+    if top_apps is None:
+        top_apps = get_top_memory_apps(3)  # Get top 3 apps
+    app_lines = []
+    for app in top_apps:
         app_name = app['name']
         mem_percent = app['memory_percent']
         if app['include_children'] and app['has_children']:
-            app_name_display = f"{app_name}: {mem_percent:.2f}% (Children)"
+            app_lines.append(f"{app_name}: {mem_percent:.2f}% (Children)")
         else:
-            app_name_display = f"{app_name}: {mem_percent:.2f}%"
-        top_right_win.addstr(2 + idx, 2, app_name_display)
-    top_right_win.refresh()
-
-# Function to draw the menu
-def draw_menu(stdscr, selected_idx):
-    # Clear the screen and refresh
-    stdscr.clear()
-    stdscr.refresh()
+            app_lines.append(f"{app_name}: {mem_percent:.2f}%")
+    app_lines = tuple(app_lines) + ("",) * (3 - len(app_lines))  # Blank rows for apps that dropped out
+
+    if last_state is None or usage_lines != last_state[0]:
+        # Update only the usage lines that changed, without clearing the entire window
+        row_width = max(top_left_win.getmaxyx()[1] - 4, 0)
+        for idx, usage_line in enumerate(usage_lines):
+            if last_state is None or usage_line != last_state[0][idx]:
+                top_left_win.addnstr(2 + idx, 2, usage_line.ljust(row_width), row_width)
+        top_left_win.noutrefresh()
+
+    if last_state is None or app_lines != last_state[1]:
+        # Rewrite only the rows that changed, padding over whatever the row held before
+        # and cutting anything that would run into the border on a narrow terminal
+        row_width = max(top_right_win.getmaxyx()[1] - 4, 0)
+        for idx, app_line in enumerate(app_lines):
+            if last_state is None or app_line != last_state[1][idx]:
+                top_right_win.addnstr(2 + idx, 2, app_line.ljust(row_width), row_width)
+        top_right_win.noutrefresh()
+
+    return usage_lines, app_lines
+
+# Function to open the menu
+# Returns a pad holding every monitored app, so scrolling only copies a different part of it to the screen
+def open_menu(stdscr, apps):
+    # Blank the screen behind the menu
+    stdscr.erase()
+    stdscr.noutrefresh()
     height, width = stdscr.getmaxyx()
     menu_win = curses.newwin(height, width, 0, 0)
     menu_win.box()
     header = "Monitored Applications (Press 'r' to restart, 'q' or Esc to exit menu)"
-    menu_win.addstr(0, (width - len(header)) // 2, header)
-    apps = list(monitored_apps.keys())
+    try:
+        menu_win.addstr(0, (width - len(header)) // 2, header)
+    except curses.error:
+        pass  # Terminal narrower than the header
+    menu_win.noutrefresh()
+
+    menu_pad = curses.newpad(max(len(apps), 1), max(width - 4, 1))
+    for idx, app_name in enumerate(apps):
+        draw_menu_row(menu_pad, idx, app_name)
+    return menu_pad
+
+# Write one menu row padded to the full pad width, so a highlight covers the whole row
+def draw_menu_row(menu_pad, idx, app_name, attr=curses.A_NORMAL):
+    row_width = menu_pad.getmaxyx()[1]
+    try:
+        menu_pad.addnstr(idx, 0, app_name.ljust(row_width), row_width, attr)
+    except curses.error:
+        pass  # Filling the pad's last cell leaves the cursor past the end
+
+# Function to draw the menu
+# Only the previously and newly selected rows are rewritten; the pad keeps the rest
+def draw_menu(stdscr, menu_pad, apps, selected_idx, previous_idx=None):
+    height, width = stdscr.getmaxyx()
     max_items = height - 4  # Adjust for borders and header
 
     # Ensure selected_idx is within the bounds
@@ -339,6 +613,10 @@ def draw_menu(stdscr, selected_idx):
     elif selected_idx >= len(apps):
         selected_idx = len(apps) - 1
 
+    if previous_idx is not None and previous_idx != selected_idx:
+        draw_menu_row(menu_pad, previous_idx, apps[previous_idx])
+    draw_menu_row(menu_pad, selected_idx, apps[selected_idx], curses.A_REVERSE)
+
     # Calculate start and end indices for the visible portion of the menu
     if len(apps) <= max_items:
         start_idx = 0
@@ -352,41 +630,37 @@ def draw_menu(stdscr, selected_idx):
             start_idx = selected_idx - max_items // 2
         end_idx = start_idx + max_items
 
-    display_apps = apps[start_idx:end_idx]
-    for idx, app_name in enumerate(display_apps):
-        line_num = 2 + idx
-        try:
-            if start_idx + idx == selected_idx:
-                menu_win.attron(curses.A_REVERSE)
-                menu_win.addstr(line_num, 2, app_name)
-                menu_win.attroff(curses.A_REVERSE)
-            else:
-                menu_win.addstr(line_num, 2, app_name)
-        except curses.error:
-            pass  # Ignore errors when writing outside the window bounds
-    menu_win.refresh()
+    if end_idx > start_idx and width > 4:
+        menu_pad.noutrefresh(start_idx, 0, 2, 2, 2 + end_idx - start_idx - 1, width - 3)
 
 # Function to display help menu
 def show_help(stdscr):
-    stdscr.clear()
-    stdscr.refresh()
+    stdscr.erase()
+    stdscr.noutrefresh()
     height, width = stdscr.getmaxyx()
     help_win = curses.newwin(height, width, 0, 0)
     help_win.box()
-    lines = APP_HELP_TEXT.strip().split('\n')
-    for idx, line in enumerate(lines):
+    for idx, line in enumerate(APP_HELP_LINES):
         try:
             help_win.addstr(1 + idx, 2, line)
         except curses.error:
             pass  # Ignore errors when writing outside the window bounds
-    help_win.refresh()
+    help_win.noutrefresh()
+    curses.doupdate()
+    stdscr.timeout(-1)  # Block until a key arrives; the main loop sets its own timeout again
     while True:
         key = stdscr.getch()
         if key == ord('q') or key == 27:  # Press 'q' or Esc to exit help
             break
-        time.sleep(0.1)
-    stdscr.clear()
-    stdscr.refresh()
+        if key == curses.KEY_RESIZE:
+            curses.ungetch(key)  # Close help and let the main loop rebuild the layout
+            break
+
+# Move a periodic deadline on by one interval so ticks stay on their original cadence
+# If the loop fell a whole interval behind (e.g. while restarting services), skip ahead instead of replaying missed ticks
+def advance_deadline(deadline, interval, now):
+    deadline += interval
+    return deadline if deadline > now else now + interval
 
 # Run the curses app
 def main():
@@ -419,67 +693,139 @@ def main():
         print("This script must be run as root to function properly.")
         sys.exit(1)
 
+    log_listener.start()
     stdscr = init_curses()
-    log_lines = []
+    log_lines = deque(maxlen=MAX_LOG_LINES)
     log_scroll_pos = 0  # For scrolling the log window
     in_menu = False     # Flag to indicate if we are in the menu
     menu_selected_idx = 0  # Index of the selected menu item
 
     try:
-        top_left_win, top_right_win, bottom_win = setup_ui(stdscr)
+        # Windows can't be created in a terminal smaller than the layout, so until a
+        # resize makes room only the "too small" notice is drawn
+        too_small = not terminal_fits(stdscr)
+        if too_small:
+            top_left_win = top_right_win = bottom_win = None
+            log_lines_visible = 1
+            draw_too_small(stdscr)
+        else:
+            top_left_win, top_right_win, bottom_win = setup_ui(stdscr)
 
-        # Determine the number of visible log lines
-        log_lines_visible = bottom_win.getmaxyx()[0] - 2  # Exclude borders
+            # Determine the number of visible log lines
+            log_lines_visible = bottom_win.getmaxyx()[0] - 2  # Exclude borders
 
         # Call log_action() after log_lines_visible is defined
         log_scroll_pos = log_action("Monitoring Started", log_lines, log_scroll_pos)
 
         # Call update_ui() immediately to display data at startup
-        update_ui(top_left_win, top_right_win)
-        update_log_window(log_lines, bottom_win, log_scroll_pos)  # Refresh the log window immediately
+        usage = get_memory_and_swap_usage()
+        top_apps = get_top_memory_apps(3)
+        ui_state = log_state = None
+        if not too_small:
+            ui_state = update_ui(top_left_win, top_right_win, usage=usage, top_apps=top_apps)
+            update_log_window(log_lines, bottom_win, log_scroll_pos)  # Refresh the log window immediately
+        # Put the panes on screen before the first check, which can take a while if swap is already high
+        curses.doupdate()
 
         # Call monitor_swap_usage() immediately to populate logs
-        log_scroll_pos = monitor_swap_usage(log_lines, bottom_win, swap_high_threshold, swap_low_threshold, log_scroll_pos)
-        update_log_window(log_lines, bottom_win, log_scroll_pos)
-
-        last_check_time = time.time()
-        last_ui_update_time = time.time()
+        log_scroll_pos, last_check_swap = monitor_swap_usage(log_lines, bottom_win, swap_high_threshold, swap_low_threshold, log_scroll_pos, usage[1])
+        if not too_small:
+            update_log_window(log_lines, bottom_win, log_scroll_pos)
+            log_state = log_window_state(log_lines, log_scroll_pos)
+
+        # Monotonic clock so wall-clock jumps don't skip or repeat checks
+        last_check_time = last_top_apps_time = time.monotonic()
+        next_ui_update_time = last_check_time + UI_UPDATE_INTERVAL
+        next_check_time = last_check_time + CHECK_INTERVAL
         while True:
-            current_time = time.time()
+            current_time = time.monotonic()
+            usage = None  # Memory/swap sample shared by everything that runs this iteration
 
             # Update UI at specified interval
-            if current_time - last_ui_update_time >= UI_UPDATE_INTERVAL:
-                if not in_menu:
-                    update_ui(top_left_win, top_right_win)
+            if current_time >= next_ui_update_time:
+                if not in_menu and not too_small:
+                    usage = get_memory_and_swap_usage()
+                    if current_time - last_top_apps_time >= TOP_APPS_UPDATE_INTERVAL:
+                        top_apps = get_top_memory_apps(3)
+                        last_top_apps_time = current_time
+                    ui_state = update_ui(top_left_win, top_right_win, ui_state, usage, top_apps)
+                    # Only redraw the logs when something was logged or scrolled
+                    if log_window_state(log_lines, log_scroll_pos) != log_state:
+                        update_log_window(log_lines, bottom_win, log_scroll_pos)
+                        log_state = log_window_state(log_lines, log_scroll_pos)
+                next_ui_update_time = advance_deadline(next_ui_update_time, UI_UPDATE_INTERVAL, current_time)
+
+            # Check swap usage every CHECK_INTERVAL seconds, or sooner once the UI sample
+            # shows swap above the high threshold and higher than where the last check left it
+            # An early check only drops caches; restarting services is left to the regular schedule
+            check_is_due = current_time >= next_check_time
+            swap_has_risen = usage is not None and usage[1] >= swap_high_threshold and usage[1] > last_check_swap
+            if check_is_due or (swap_has_risen and current_time - last_check_time >= MIN_CHECK_INTERVAL):
+                if usage is None:
+                    usage = get_memory_and_swap_usage()
+                log_scroll_pos, last_check_swap = monitor_swap_usage(log_lines, bottom_win, swap_high_threshold, swap_low_threshold, log_scroll_pos, usage[1], check_is_due)
+                last_check_time = time.monotonic()  # Restarts can take longer than MIN_CHECK_INTERVAL
+                if check_is_due:
+                    next_check_time = advance_deadline(next_check_time, CHECK_INTERVAL, last_check_time)
+                # Keep the regular check from following an early one within MIN_CHECK_INTERVAL
+                next_check_time = max(next_check_time, last_check_time + MIN_CHECK_INTERVAL)
+                last_top_apps_time = current_time - TOP_APPS_UPDATE_INTERVAL  # Services may have been restarted, so rescan
+
+            # Push everything drawn since the last wait to the terminal in one go
+            curses.doupdate()
+
+            # Handle user input, blocking in getch() until a key arrives or the next timer is due
+            # A swap check can take a while, so measure the wait from now rather than from current_time
+            next_event_time = min(next_ui_update_time, next_check_time)
+            stdscr.timeout(max(0, int((next_event_time - time.monotonic()) * 1000)))
+            key = stdscr.getch()
+            if key == curses.KEY_RESIZE:
+                # The terminal changed size, so rebuild the layout for the new dimensions
+                curses.update_lines_cols()
+                at_bottom = log_scroll_pos >= len(log_lines) - log_lines_visible
+                stdscr.erase()
+                too_small = not terminal_fits(stdscr)
+                if too_small:
+                    draw_too_small(stdscr)
+                    continue
+                top_left_win, top_right_win, bottom_win = setup_ui(stdscr)
+                log_lines_visible = bottom_win.getmaxyx()[0] - 2  # Exclude borders
+                max_scroll = max(len(log_lines) - log_lines_visible, 0)
+                log_scroll_pos = max_scroll if at_bottom else min(log_scroll_pos, max_scroll)
+                # The new windows are blank, so the next redraw must not skip anything
+                ui_state = log_state = None
+                if in_menu:
+                    menu_pad = open_menu(stdscr, MON_NAMES)
+                    draw_menu(stdscr, menu_pad, MON_NAMES, menu_selected_idx)
+                else:
+                    ui_state = update_ui(top_left_win, top_right_win, top_apps=top_apps)
                     update_log_window(log_lines, bottom_win, log_scroll_pos)
-                last_ui_update_time = current_time
+                    log_state = log_window_state(log_lines, log_scroll_pos)
+                continue
 
-            # Check swap usage every CHECK_INTERVAL seconds
-            if current_time - last_check_time >= CHECK_INTERVAL:
-                log_scroll_pos = monitor_swap_usage(log_lines, bottom_win, swap_high_threshold, swap_low_threshold, log_scroll_pos)
-                last_check_time = current_time
+            # Nothing is on screen to act on until the terminal is big enough again
+            if too_small:
+                if key == ord('q') and not in_menu:
+                    break
+                continue
 
-            # Handle user input
-            key = stdscr.getch()
             if in_menu:
                 if key == curses.KEY_UP:
+                    previous_idx = menu_selected_idx
                     menu_selected_idx = max(0, menu_selected_idx - 1)
-                    draw_menu(stdscr, menu_selected_idx)
+                    draw_menu(stdscr, menu_pad, MON_NAMES, menu_selected_idx, previous_idx)
                 elif key == curses.KEY_DOWN:
-                    menu_selected_idx = min(len(monitored_apps) - 1, menu_selected_idx + 1)
-                    draw_menu(stdscr, menu_selected_idx)
+                    previous_idx = menu_selected_idx
+                    menu_selected_idx = min(len(MON_NAMES) - 1, menu_selected_idx + 1)
+                    draw_menu(stdscr, menu_pad, MON_NAMES, menu_selected_idx, previous_idx)
                 elif key == ord('r'):
-                    # Restart selected service
-                    proc_name = list(monitored_apps.keys())[menu_selected_idx]
-                    service_name = monitored_apps[proc_name][0]
+                    # Restart selected service; the menu itself doesn't change
+                    service_name = MON_SERVICE_BY_NAME[MON_NAMES[menu_selected_idx]]
                     log_scroll_pos = restart_app(service_name, log_lines, log_scroll_pos)
-                    draw_menu(stdscr, menu_selected_idx)
                 elif key == ord('q') or key == 27:  # Escape key
                     in_menu = False
-                    stdscr.clear()
-                    stdscr.refresh()
-                    top_left_win, top_right_win, bottom_win = setup_ui(stdscr)
-                    update_ui(top_left_win, top_right_win)
+                    restore_ui(stdscr, top_left_win, top_right_win, bottom_win)
+                    # Pick up anything logged by restarts from the menu
                     update_log_window(log_lines, bottom_win, log_scroll_pos)
                 continue  # Skip the rest of the loop when in menu
 
@@ -488,27 +834,26 @@ def main():
             elif key == ord('m'):
                 in_menu = True
                 menu_selected_idx = 0
-                draw_menu(stdscr, menu_selected_idx)
+                menu_pad = open_menu(stdscr, MON_NAMES)
+                draw_menu(stdscr, menu_pad, MON_NAMES, menu_selected_idx)
             elif key == ord('?'):
                 show_help(stdscr)
-                # After help screen, redraw the UI
-                stdscr.clear()
-                stdscr.refresh()
-                top_left_win, top_right_win, bottom_win = setup_ui(stdscr)
-                update_ui(top_left_win, top_right_win)
-                update_log_window(log_lines, bottom_win, log_scroll_pos)
+                # After help screen, repaint the existing windows
+                restore_ui(stdscr, top_left_win, top_right_win, bottom_win)
             elif key == curses.KEY_UP:
-                log_scroll_pos = max(0, log_scroll_pos - 1)
-                update_log_window(log_lines, bottom_win, log_scroll_pos)
+                new_pos = max(0, log_scroll_pos - 1)
+                if new_pos != log_scroll_pos:  # Nothing to redraw when already at the top
+                    log_scroll_pos = new_pos
+                    update_log_window(log_lines, bottom_win, log_scroll_pos)
             elif key == curses.KEY_DOWN:
                 max_scroll = max(len(log_lines) - log_lines_visible, 0)
-                log_scroll_pos = min(max_scroll, log_scroll_pos + 1)
-                update_log_window(log_lines, bottom_win, log_scroll_pos)
-
-            # Short sleep to prevent high CPU usage
-            time.sleep(0.1)
+                new_pos = min(max_scroll, log_scroll_pos + 1)
+                if new_pos != log_scroll_pos:  # Nothing to redraw when already at the bottom
+                    log_scroll_pos = new_pos
+                    update_log_window(log_lines, bottom_win, log_scroll_pos)
     finally:
         close_curses(stdscr)
+        log_listener.stop()  # Flushes anything still queued to LOG_FILE
 
 if __name__ == '__main__':
     main()